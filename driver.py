@@ -18,15 +18,13 @@ import random
 
 import ktour
 
+import krecord
 
-def prog(stdscr): # -----------------------------------------------------------
-    """ This FUNCTION ...
-    """ # ---------------------------------------------------------------------
-
-    global board
-
-    global knight
 
+def initWindows(stdscr, size: int): # -----------------------------------------
+    """ This FUNCTION initializes the colors and the windows for displaying a
+        square (n x n) chessboard, and returns the window of its squares.
+    """ # ---------------------------------------------------------------------
 
     # NOTE: This program presumes the terminal is capable of displaying color.
 
@@ -54,16 +52,16 @@ def prog(stdscr): # -----------------------------------------------------------
     #       sufficient for displaying the size of the chessboard window.
 
     board_win = stdscr.subwin(\
-        (board.size+3), ((board.size * 4)+5), 1, 1\
+        (size+3), ((size * 4)+5), 1, 1\
     )
 
-    for i in range (0, board.size):
+    for i in range (0, size):
 
         board_win.move(0, ((i * 4)+6))
 
         board_win.addstr(ktour.getColumnLetter(i))
 
-        board_win.move((board.size-i+1), 0)
+        board_win.move((size-i+1), 0)
 
         board_win.addstr("{0:3d}".format(i+1))
 
@@ -71,7 +69,7 @@ def prog(stdscr): # -----------------------------------------------------------
 
 
     squares_win = board_win.subwin(\
-        (board.size+2), ((board.size*4)+1), 2, 5\
+        (size+2), ((size*4)+1), 2, 5\
     )
     
     squares_win.bkgd(curses.color_pair(1))
@@ -79,6 +77,21 @@ def prog(stdscr): # -----------------------------------------------------------
     squares_win.box()
 
 
+    return squares_win
+
+
+def prog(stdscr): # -----------------------------------------------------------
+    """ This FUNCTION ...
+    """ # ---------------------------------------------------------------------
+
+    global board
+
+    global knight
+
+
+    squares_win = initWindows(stdscr, board.size)
+
+
     while True:
 
         # Populate a dictionary with all positions (as key) not yet traversed
@@ -164,6 +177,132 @@ def prog(stdscr): # -----------------------------------------------------------
             break   # If there is no such position, break out of the loop.
 
 
+def replay(stdscr): # ---------------------------------------------------------
+    """ This FUNCTION displays the chessboard after any move of a rec.
+        Only the squares that differ between one move and the next displayed
+        are drawn.
+    """ # ---------------------------------------------------------------------
+
+    global recording
+
+
+    rec = recording
+
+    size = rec.size
+
+    squares_win = initWindows(stdscr, size)
+
+
+    def getSquare(move_i: int): # ---------------------------------------------
+
+        return rec.getSquares(move_i, move_i)[0]\
+            if (0 < move_i <= rec.move_n) else None
+
+
+    def drawSquare(sq: int, move_i: int, cur: int, nxt: int): # ---------------
+
+        i, j = (sq // size), (sq % size)
+
+        v = rec.squares[i][j]
+
+        c = 2 if (sq == nxt) else\
+            (3 if (sq == cur) else\
+                (5 if (((j+i) % 2) == 0) else 6)\
+            )
+
+        squares_win.move((size-i), (j*4)+1)
+
+        squares_win.addstr(\
+            "{0:03d}".format(v) if (0 < v <= move_i) else "   ",\
+            curses.color_pair(c)\
+        )
+
+
+    move_i = 1
+
+    cur, nxt = getSquare(move_i), getSquare(move_i+1)
+
+    for sq in range(0, (size * size)): drawSquare(sq, move_i, cur, nxt)
+
+
+    digits = ""
+
+    while True:
+
+        squares_win.refresh()
+
+
+        stdscr.move((size+4), 1)
+
+        stdscr.clrtoeol()
+
+        stdscr.addstr(\
+            "{0:03d} of {1:03d} : (n)ext (p)rev (g/G)first/last (q)uit {2}"\
+            .format(move_i, rec.move_n, digits)\
+        )
+
+        stdscr.move(0, 0)   # Move cursor somewhere inconsequential.
+
+
+        key = stdscr.getch()
+
+        if key in (ord('q'), ord('Q')): break
+
+
+        # Determine which move to display next.  A move number can be entered
+        # (followed by Enter) to jump directly to that move.
+
+        if (ord('0') <= key <= ord('9')):
+
+            digits += chr(key)
+
+            continue
+
+        elif key in (curses.KEY_ENTER, 10, 13) and not (digits == ""):
+
+            move_j = int(digits)
+
+        elif key in (curses.KEY_LEFT, ord('p')):
+
+            move_j = move_i - 1
+
+        elif key in (curses.KEY_HOME, ord('g')):
+
+            move_j = 1
+
+        elif key in (curses.KEY_END, ord('G')):
+
+            move_j = rec.move_n
+
+        else:
+
+            move_j = move_i + 1
+
+        digits = ""
+
+        move_j = max(1, min(move_j, rec.move_n))
+
+
+        # Only the squares traversed between the moves displayed, as well as
+        # the knight's current and next positions, need to be drawn again.
+
+        lo, hi = min(move_i, move_j), max(move_i, move_j)
+
+        sqs = set(rec.getSquares((lo+1), hi)) if (lo < hi) else set()
+
+        sqs.update(sq for sq in (cur, nxt) if sq is not None)
+
+
+        move_i = move_j
+
+        cur, nxt = getSquare(move_i), getSquare(move_i+1)
+
+        sqs.update(sq for sq in (cur, nxt) if sq is not None)
+
+
+        for sq in sqs: drawSquare(sq, move_i, cur, nxt)
+
+
 def exit(): # -----------------------------------------------------------------
     """ This FUNCTION exits the program.
     """ # ---------------------------------------------------------------------
@@ -213,6 +352,8 @@ def main(): # -----------------------------------------------------------------
 
     global knight
 
+    global recording
+
 
     argparser = argparse.ArgumentParser(\
         description= "This PROGRAM implements Warnsdorff's heuristic for\
@@ -241,10 +382,48 @@ def main(): # -----------------------------------------------------------------
         help=    "seed for pseudo-random number generation"\
     )
 
+    argparser.add_argument(\
+        '--closed',\
+        action=  'store_true',\
+        help=    "convert the tour into a closed tour (if complete)"\
+    )
+
+    argparser.add_argument(\
+        '--record',\
+        metavar= "FILE",\
+        type=    str,\
+        help=    "record each move of the knight to a file"\
+    )
+
+    argparser.add_argument(\
+        '--replay',\
+        metavar= "FILE",\
+        type=    str,\
+        help=    "replay a recording instead"\
+    )
+
 
     args = argparser.parse_args()
 
 
+    if args.replay is not None:
+
+        try:
+
+            recording = krecord.Recording(args.replay)
+
+        except (OSError, krecord.RecordingInvalidError) as e:
+
+            argparser.error(str(e))
+
+        curses.wrapper(replay)
+
+        recording.close()
+
+
+        quit()
+
+
     # If no seed was provided as an argument, initialize pseudo-randomization
     # with current system time as seed.  Otherwise, use seed number provided.
 
@@ -281,6 +460,34 @@ def main(): # -----------------------------------------------------------------
     curses.wrapper(prog)
 
 
+    if args.closed and board.isTraversed():
+
+        # Convert the open tour performed by the knight piece into a closed
+        # tour (if possible) and perform that tour on a new chessboard instead.
+
+        tour = ktour.closeTour(knight, board.size)
+
+        if tour is not None:
+
+            board = ktour.Chessboard(args.size)
+
+            knight = ktour.Knight(board, tour[0])
+
+            for pos in tour[1:]: knight.move(board, pos)
+
+        else:
+
+            print("\nfailed to convert the tour into a closed tour")
+
+
+    # NOTE: The tour is recorded after it is converted into a closed tour (if
+    #       requested), so the recording is always of the tour printed.
+
+    if args.record is not None:
+
+        krecord.writeRecording(args.record, knight, board.size)
+
+
     exit()  # Exit the program formally.
 
 
@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+
+
+# -----------------------------------------------------------------------------
+""" This MODULE contains the implementation for exhaustively enumerating (and
+    counting) every knight's tour from a start position on small chessboards.
+""" # -------------------------------------------------------------------------
+
+__author__ = '@kaethis'
+
+__version__ = '1.0'
+
+
+import argparse
+
+import multiprocessing
+
+import ktour
+
+from argparse import ArgumentTypeError
+
+from typing import Callable, Dict, Iterator, List, Tuple
+
+
+# NOTE: The state of the chessboard is represented as a bitboard, (i.e. an
+#       integer whose n-th bit is set if the n-th square has been traversed).
+#       The n-th square of the chessboard is the square in row (n // size) and
+#       column (n % size).
+
+MEMO_CAPACITY = (1 << 20)
+
+
+def getJumpMasks(size: int) -> List[int]: # -----------------------------------
+    """ This FUNCTION returns a list containing, for each square of a square
+        (n x n) chessboard, a bitboard of every square a jump away from it.
+    """ # ---------------------------------------------------------------------
+
+    table = ktour.getJumpTable(size)
+
+
+    masks = [0] * (size * size)
+
+    for i in range(0, size):
+
+        for j in range(0, size):
+
+            for (r, c) in table[i][j]:
+
+                masks[(i * size) + j] |= (1 << ((r * size) + c))
+
+
+    return masks
+
+
+def getSymmetries(\
+        size: int\
+    ) -> List[Callable[[int, int], Tuple[int, int]]]: # -----------------------
+    """ This FUNCTION returns a list of the eight symmetries (rotations and
+        reflections) of a square (n x n) chessboard as functions of a row and
+        column.
+    """ # ---------------------------------------------------------------------
+
+    m = (size-1)
+
+
+    return [\
+        lambda i, j: (i, j),         lambda i, j: (j, (m-i)),\
+        lambda i, j: ((m-i), (m-j)), lambda i, j: ((m-j), i),\
+        lambda i, j: (i, (m-j)),     lambda i, j: ((m-i), j),\
+        lambda i, j: (j, i),         lambda i, j: ((m-j), (m-i))\
+    ]
+
+
+def isDeadEnd(masks: List[int], visited: int, sq: int) -> bool: # -------------
+    """ This FUNCTION returns whether or not no tour can be completed from a
+        state of the chessboard, (i.e. a bitboard of the squares traversed and
+        the knight's current square).
+    """ # ---------------------------------------------------------------------
+
+    # NOTE: A square not yet traversed (that is not a jump away from the
+    #       knight's current square) without any squares not yet traversed a
+    #       jump away from it can never be reached.  If it has only one, it can
+    #       only be reached by the very last move, so there can be no more than
+    #       one such square.
+
+    free = ((1 << len(masks)) - 1) & ~visited & ~masks[sq]
+
+    ends_n = 0
+
+    while free:
+
+        bit = free & -free
+
+        free ^= bit
+
+        act_n = (masks[bit.bit_length()-1] & ~visited).bit_count()
+
+        if (act_n == 0): return True
+
+        if (act_n == 1): ends_n += 1
+
+        if (ends_n > 1): return True
+
+
+    return False
+
+
+def countTours(\
+        size: int, prefix: Tuple[int, ...],\
+        capacity: int= MEMO_CAPACITY\
+    ) -> Tuple[int, int]: # ---------------------------------------------------
+    """ This FUNCTION returns a tuple containing the number of tours and the
+        number of closed tours, (i.e. those that end a jump away from the start
+        position), that begin with a specified sequence of squares.
+
+        The number of tours from each state of the chessboard, (i.e. the set of
+        squares traversed and the knight's current square), is memoized in a
+        transposition table, since many sequences of moves lead to the same
+        state.
+    """ # ---------------------------------------------------------------------
+
+    masks = getJumpMasks(size)
+
+    squares_n = (size * size)
+
+    start_mask = masks[prefix[0]]
+
+    memo = ktour.TranspositionTable(capacity)
+
+
+    def count(visited: int, sq: int, remaining: int) -> Tuple[int, int]: # ----
+
+        if (remaining == 0):
+
+            return (1, 1) if (start_mask >> sq) & 1 else (1, 0)
+
+
+        key = (visited * squares_n) + sq
+
+        result = memo.lookup(key)
+
+        if result is not None: return result
+
+
+        if isDeadEnd(masks, visited, sq):
+
+            memo.store(key, (squares_n - remaining), (0, 0))
+
+            return (0, 0)
+
+
+        tours_n, closed_n = 0, 0
+
+        free = masks[sq] & ~visited
+
+        while free:
+
+            bit = free & -free
+
+            free ^= bit
+
+            t, c = count((visited | bit), (bit.bit_length()-1), (remaining-1))
+
+            tours_n += t
+
+            closed_n += c
+
+
+        memo.store(key, (squares_n - remaining), (tours_n, closed_n))
+
+        return (tours_n, closed_n)
+
+
+    visited = 0
+
+    for sq in prefix: visited |= (1 << sq)
+
+
+    return count(visited, prefix[-1], (squares_n - len(prefix)))
+
+
+def iterTours(size: int, start: str) -> Iterator[Tuple[str, ...]]: # ----------
+    """ This FUNCTION yields every tour (as a tuple of positions in algebraic
+        notation) from a specified start position (in algebraic notation).
+    """ # ---------------------------------------------------------------------
+
+    masks = getJumpMasks(size)
+
+    squares_n = (size * size)
+
+    poses = [\
+        ktour.getAlgebraicNotation((sq // size), (sq % size))\
+        for sq in range(0, squares_n)\
+    ]
+
+
+    row, col = ktour.getRowColumn(start)
+
+    path = [(row * size) + col]
+
+
+    def walk(visited: int) -> Iterator[Tuple[str, ...]]: # --------------------
+
+        if (len(path) == squares_n):
+
+            yield tuple(poses[sq] for sq in path)
+
+            return
+
+        if isDeadEnd(masks, visited, path[-1]): return
+
+
+        free = masks[path[-1]] & ~visited
+
+        while free:
+
+            bit = free & -free
+
+            free ^= bit
+
+            path.append(bit.bit_length()-1)
+
+            yield from walk(visited | bit)
+
+            path.pop()
+
+
+    yield from walk(1 << path[0])
+
+
+def getPrefixes(\
+        size: int, start: str, depth: int\
+    ) -> Dict[Tuple[int, ...], int]: # ----------------------------------------
+    """ This FUNCTION returns a dictionary containing every sequence of squares
+        of a specified length from a start position (as key) that is unique
+        up to the symmetries of the chessboard that fix the start position,
+        and the number of sequences equivalent to it (as value).
+    """ # ---------------------------------------------------------------------
+
+    masks = getJumpMasks(size)
+
+    row, col = ktour.getRowColumn(start)
+
+    syms = [\
+        sym for sym in getSymmetries(size) if (sym(row, col) == (row, col))\
+    ]
+
+
+    def transform(sym, prefix: Tuple[int, ...]) -> Tuple[int, ...]: # ---------
+
+        rcs = (sym((sq // size), (sq % size)) for sq in prefix)
+
+        return tuple(((r * size) + c) for (r, c) in rcs)
+
+
+    # NOTE: No sequence of squares can be longer than the number of squares on
+    #       the chessboard, so the length is limited to that number.
+
+    prefixes: List[Tuple[int, ...]] = [((row * size) + col,)]
+
+    for i in range(1, min(depth, (size * size))):
+
+        prefixes = [\
+            prefix + (sq,) for prefix in prefixes\
+            for sq in range(0, (size * size))\
+            if (masks[prefix[-1]] >> sq) & 1 and sq not in prefix\
+        ]
+
+
+    uniques: Dict[Tuple[int, ...], int] = {}
+
+    for prefix in prefixes:
+
+        key = min(transform(sym, prefix) for sym in syms)
+
+        uniques[key] = uniques.get(key, 0) + 1
+
+
+    return uniques
+
+
+def countToursFrom(\
+        size: int, start: str, depth: int= 3, workers: int= 1\
+    ) -> Tuple[int, int]: # ---------------------------------------------------
+    """ This FUNCTION returns a tuple containing the number of tours and the
+        number of closed tours from a specified start position (in algebraic
+        notation).
+
+        The search is split by every sequence of the first few moves (unique up
+        to symmetry) and distributed across a specified number of processes.
+    """ # ---------------------------------------------------------------------
+
+    prefixes = getPrefixes(size, start, depth)
+
+    jobs = [(size, prefix) for prefix in prefixes.keys()]
+
+
+    if (workers > 1):
+
+        with multiprocessing.Pool(workers) as pool:
+
+            results = pool.starmap(countTours, jobs)
+
+    else:
+
+        results = [countTours(*job) for job in jobs]
+
+
+    tours_n, closed_n = 0, 0
+
+    for (prefix_n, (t, c)) in zip(prefixes.values(), results):
+
+        tours_n += (prefix_n * t)
+
+        closed_n += (prefix_n * c)
+
+
+    return (tours_n, closed_n)
+
+
+def countAllTours(\
+        size: int, depth: int= 3, workers: int= 1\
+    ) -> Dict[str, Tuple[int, int]]: # ----------------------------------------
+    """ This FUNCTION returns a dictionary containing every position (as key)
+        and corresponding number of tours and closed tours from that position
+        (as value).  Only one start position of each set of positions
+        equivalent by symmetry is searched.
+    """ # ---------------------------------------------------------------------
+
+    syms = getSymmetries(size)
+
+
+    counts: Dict[str, Tuple[int, int]] = {}
+
+    for i in range(0, size):
+
+        for j in range(0, size):
+
+            pos = ktour.getAlgebraicNotation(i, j)
+
+            if pos in counts: continue
+
+
+            result = countToursFrom(size, pos, depth, workers)
+
+            for sym in syms:
+
+                counts[ktour.getAlgebraicNotation(*sym(i, j))] = result
+
+
+    return dict(sorted(\
+        counts.items(), key=lambda item: ktour.getRowColumn(item[0])\
+    ))
+
+
+def validateDepth(depth: str) -> int: # ---------------------------------------
+    """ This FUNCTION ...
+    """ # ---------------------------------------------------------------------
+
+    if not (int(depth) >= 1):
+
+        msg = "invalid num of first moves (min {0:3d})".format(1)
+
+        raise ArgumentTypeError(msg)
+
+
+    return int(depth)
+
+
+def main(): # -----------------------------------------------------------------
+    """ This MAIN FUNCTION ...
+    """ # ---------------------------------------------------------------------
+
+    argparser = argparse.ArgumentParser(\
+        description= "This PROGRAM counts (or lists) every knight's tour from\
+                      each start position on a small chessboard.",\
+        epilog=      "~created by " + __author__\
+    )
+
+    argparser.add_argument(\
+        '--size',\
+        metavar= "N",\
+        type=    ktour.validateSize,\
+        default= "5",\
+        help=    "number of squares per row/column"\
+    )
+
+    argparser.add_argument(\
+        '--start',\
+        metavar= "P",\
+        type=    str,\
+        help=    "start position of knight (in algebraic notation)"\
+    )
+
+    argparser.add_argument(\
+        '--depth',\
+        metavar= "K",\
+        type=    validateDepth,\
+        default= 3,\
+        help=    "number of first moves by which the search is split"\
+    )
+
+    argparser.add_argument(\
+        '--workers',\
+        metavar= "W",\
+        type=    int,\
+        default= multiprocessing.cpu_count(),\
+        help=    "number of processes"\
+    )
+
+    argparser.add_argument(\
+        '--list',\
+        action=  'store_true',\
+        help=    "list every tour from the start position instead"\
+    )
+
+
+    args = argparser.parse_args()
+
+
+    if not (args.depth <= (args.size * args.size)):
+
+        argparser.error(\
+            "invalid num of first moves for size of chessboard (max {0:3d})"\
+            .format(args.size * args.size)\
+        )
+
+    if args.list and (args.start is None):
+
+        argparser.error("--list requires --start")
+
+
+    if args.start is not None:
+
+        start = ktour.validateStartPosition(args.start, args.size)
+
+
+        if args.list:
+
+            for tour in iterTours(args.size, start):
+
+                print(" ".join(tour))
+
+        else:
+
+            counts = {\
+                start : countToursFrom(\
+                    args.size, start, args.depth, args.workers\
+                )\
+            }
+
+    else:
+
+        counts = countAllTours(args.size, args.depth, args.workers)
+
+
+    if not ((args.start is not None) and args.list):
+
+        for pos, (tours_n, closed_n) in counts.items():
+
+            row, col = ktour.getRowColumn(pos)
+
+            print("({0},{1}) {2} : {3} open, {4} closed"\
+                .format(\
+                    str(row).rjust(2),\
+                    str(col).rjust(2),\
+                    ('\''+pos+'\'').rjust(5),\
+                    (tours_n - closed_n),\
+                    closed_n\
+                )
+            )
+
+
+if __name__ == '__main__': main()
@@ -0,0 +1,570 @@
+#!/usr/bin/env python3
+
+
+# -----------------------------------------------------------------------------
+""" This MODULE contains the data structures and implementation for attempting
+    to solve the knight's tour problem on chessboards too large to be kept in
+    memory, by storing the chessboard and each move performed by the knight
+    piece in memory-mapped files that can be checkpointed and resumed.
+""" # -------------------------------------------------------------------------
+
+__author__ = '@kaethis'
+
+__version__ = '1.0'
+
+
+import argparse
+
+import json
+
+import mmap
+
+import os
+
+import random
+
+import ktour
+
+from argparse import ArgumentTypeError
+
+from typing import Dict, Iterator, List, Tuple, cast
+
+
+# NOTE: Both the chessboard and the move log are stored as arrays of unsigned
+#       32-bit integers, so the number of squares on the chessboard must be
+#       less than 2^32.  Squares are referred to by number, (i.e. the square in
+#       row (n // size) and column (n % size)).
+
+BOARD_FILE = 'board.dat'
+
+MOVES_FILE = 'moves.dat'
+
+CHECKPOINT_FILE = 'checkpoint.json'
+
+SIZE_MAX = 65535
+
+
+class MappedArray: # ----------------------------------------------------------
+    """ This CLASS represents an array of unsigned 32-bit integers (all zero
+        initially) stored in a memory-mapped file.
+    """ # ---------------------------------------------------------------------
+
+    def __init__(self, path: str, length: int): # -----------------------------
+        """ This CONSTRUCTOR ...
+        """ # -----------------------------------------------------------------
+
+        # NOTE: Extending the file (rather than writing zeros) allows sparse
+        #       files, so only the pages that are written take up any space.
+
+        open(path, 'ab').close()
+
+        self.file = open(path, 'r+b')
+
+        if (os.path.getsize(path) < (length * 4)):
+
+            self.file.truncate(length * 4)
+
+
+        self.map = mmap.mmap(self.file.fileno(), (length * 4))
+
+        self.view = memoryview(self.map).cast('I')
+
+
+    def clear(self, start: int, end: int): # ----------------------------------
+        """ This FUNCTION sets every integer from one index to another
+            (exclusive) to zero.
+        """ # -----------------------------------------------------------------
+
+        chunk = (1 << 20)
+
+        for i in range((start * 4), (end * 4), chunk):
+
+            n = min(chunk, ((end * 4) - i))
+
+            self.map[i:(i+n)] = bytes(n)
+
+
+    def flush(self): # --------------------------------------------------------
+        """ This FUNCTION ...
+        """ # -----------------------------------------------------------------
+
+        self.map.flush()
+
+
+    def close(self): # --------------------------------------------------------
+        """ This FUNCTION ...
+        """ # -----------------------------------------------------------------
+
+        self.view.release()
+
+        self.map.close()
+
+        self.file.close()
+
+
+class MappedChessboard(ktour.Chessboard): # -----------------------------------
+    """ This CLASS represents a square (n x n) chessboard stored in a memory-
+        mapped file.  Each row of squares is a view of the file, so it can be
+        used anywhere a Chessboard can.
+    """ # ---------------------------------------------------------------------
+
+    def __init__(self, size: int, path: str): # -------------------------------
+        """ This CONSTRUCTOR ...
+        """ # -----------------------------------------------------------------
+
+        self.size = size
+
+        self.array = MappedArray(path, (size * size))
+
+        self.rows = [\
+            self.array.view[(i * size):((i+1) * size)]\
+            for i in range(0, size)\
+        ]
+
+        # NOTE: Each row is a view of unsigned integers rather than a list,
+        #       but it is indexed (and assigned) just the same.
+
+        self.squares = cast(List[List[int]], self.rows)
+
+
+    def flush(self): # --------------------------------------------------------
+        """ This FUNCTION ...
+        """ # -----------------------------------------------------------------
+
+        self.array.flush()
+
+
+    def close(self): # --------------------------------------------------------
+        """ This FUNCTION ...
+        """ # -----------------------------------------------------------------
+
+        for row in self.rows: row.release()
+
+        self.array.close()
+
+
+class MoveLog: # --------------------------------------------------------------
+    """ This CLASS represents each move performed by a knight piece (in the
+        same form as Knight.moves) stored in a memory-mapped file.  Only the
+        square moved to is stored for each move.
+    """ # ---------------------------------------------------------------------
+
+    def __init__(self, size: int, path: str): # -------------------------------
+        """ This CONSTRUCTOR ...
+        """ # -----------------------------------------------------------------
+
+        self.size = size
+
+        self.array = MappedArray(path, (size * size))
+
+        self.move_n = 0
+
+
+    def __len__(self) -> int: # -----------------------------------------------
+
+        return self.move_n
+
+
+    def __iter__(self) -> Iterator[int]: # ------------------------------------
+
+        return iter(range(1, (self.move_n+1)))
+
+
+    def keys(self) -> Iterator[int]: # ----------------------------------------
+        """ This FUNCTION ...
+        """ # -----------------------------------------------------------------
+
+        return iter(self)
+
+
+    def __getitem__(self, move_i: int) -> Tuple[str, str]: # ------------------
+
+        if not (0 < move_i <= self.move_n):
+
+            raise KeyError(move_i)
+
+
+        pos_to = self.getPosition(move_i)
+
+        pos_from = self.getPosition(move_i-1) if (move_i > 1) else "__"
+
+
+        return (pos_from, pos_to)
+
+
+    def __setitem__(self, move_i: int, move: Tuple[str, str]): # --------------
+
+        # NOTE: Moves can only be appended to the log.
+
+        if not (move_i == (self.move_n+1)):
+
+            raise KeyError(move_i)
+
+
+        row, col = ktour.getRowColumn(move[1])
+
+        self.array.view[move_i-1] = ((row * self.size) + col) + 1
+
+        self.move_n = move_i
+
+
+    def pop(self, move_i: int) -> Tuple[str, str]: # --------------------------
+        """ This FUNCTION removes the last move from the log and returns it.
+        """ # -----------------------------------------------------------------
+
+        # NOTE: Only the last move can be removed from the log.
+
+        if not (move_i == self.move_n) or (move_i == 0):
+
+            raise KeyError(move_i)
+
+
+        move = self[move_i]
+
+        self.array.view[move_i-1] = 0
+
+        self.move_n -= 1
+
+
+        return move
+
+
+    def getPosition(self, move_i: int) -> str: # ------------------------------
+        """ This FUNCTION returns the position (in algebraic notation) moved to
+            by a specified move.
+        """ # -----------------------------------------------------------------
+
+        sq = self.array.view[move_i-1] - 1
+
+        return ktour.getAlgebraicNotation((sq // self.size), (sq % self.size))
+
+
+    def flush(self): # --------------------------------------------------------
+        """ This FUNCTION ...
+        """ # -----------------------------------------------------------------
+
+        self.array.flush()
+
+
+    def close(self): # --------------------------------------------------------
+        """ This FUNCTION ...
+        """ # -----------------------------------------------------------------
+
+        self.array.close()
+
+
+class MappedKnight(ktour.Knight): # -------------------------------------------
+    """ This CLASS represents a knight piece whose moves are stored in a move
+        log in a memory-mapped file.
+    """ # ---------------------------------------------------------------------
+
+    log: MoveLog
+
+    def __init__(\
+            self, board: MappedChessboard, start: str, path: str\
+        ): # ------------------------------------------------------------------
+        """ This CONSTRUCTOR ...
+        """ # -----------------------------------------------------------------
+
+        row, col = ktour.getRowColumn(start)
+
+        if not (0 <= row < board.size) or not (0 <= col < board.size):
+
+            raise ktour.PositionInvalidError(start)
+
+        if board.isTraversed(start):
+
+            raise ktour.PositionTraversedError(start, board.getSquare(start))
+
+
+        self.log = MoveLog(board.size, path)
+
+        self.moves = cast(Dict[int, Tuple[str, str]], self.log)
+
+        self.move_n = 1
+
+        self.moves[self.move_n] = ("__", start)
+
+        self.pos = start
+
+
+        board.setSquare(self.pos, self.move_n)
+
+
+def create(\
+        directory: str, size: int, start: str, force: bool= False\
+    ) -> Tuple[MappedChessboard, MappedKnight]: # -----------------------------
+    """ This FUNCTION returns a new chessboard and knight piece at a specified
+        start position (in algebraic notation), stored in a directory.
+
+        If the directory already contains a chessboard, a FileExistsError is
+        RAISED unless it is to be overwritten.
+    """ # ---------------------------------------------------------------------
+
+    os.makedirs(directory, exist_ok=True)
+
+    for name in (BOARD_FILE, MOVES_FILE, CHECKPOINT_FILE):
+
+        path = os.path.join(directory, name)
+
+        if os.path.exists(path) and not force:
+
+            raise FileExistsError(path)
+
+    for name in (BOARD_FILE, MOVES_FILE, CHECKPOINT_FILE):
+
+        path = os.path.join(directory, name)
+
+        if os.path.exists(path): os.remove(path)
+
+
+    board = MappedChessboard(size, os.path.join(directory, BOARD_FILE))
+
+    knight = MappedKnight(board, start, os.path.join(directory, MOVES_FILE))
+
+
+    return (board, knight)
+
+
+def checkpoint(\
+        directory: str, board: MappedChessboard, knight: MappedKnight\
+    ): # ----------------------------------------------------------------------
+    """ This FUNCTION commits every move performed by the knight piece (and
+        the state of pseudo-random number generation) to a checkpoint, from
+        which the tour can be resumed.
+    """ # ---------------------------------------------------------------------
+
+    # NOTE: Both files are flushed before the checkpoint is (atomically)
+    #       replaced, so a checkpoint never refers to a move that has not been
+    #       written.
+
+    board.flush()
+
+    knight.log.flush()
+
+
+    state = {\
+        'size'   : board.size,\
+        'move_n' : knight.move_n,\
+        'random' : random.getstate()\
+    }
+
+    path = os.path.join(directory, CHECKPOINT_FILE)
+
+    with open(path + '.tmp', 'w') as f:
+
+        json.dump(state, f)
+
+        f.flush()
+
+        os.fsync(f.fileno())
+
+    os.replace(path + '.tmp', path)
+
+
+def resume(directory: str) -> Tuple[MappedChessboard, MappedKnight]: # --------
+    """ This FUNCTION returns the chessboard and knight piece stored in a
+        directory as of its last checkpoint.  Any move performed after the
+        last checkpoint is undone.
+    """ # ---------------------------------------------------------------------
+
+    with open(os.path.join(directory, CHECKPOINT_FILE)) as f:
+
+        state = json.load(f)
+
+
+    size = state['size']
+
+    board = MappedChessboard(size, os.path.join(directory, BOARD_FILE))
+
+    knight = MappedKnight.__new__(MappedKnight)
+
+    knight.log = MoveLog(size, os.path.join(directory, MOVES_FILE))
+
+    knight.moves = cast(Dict[int, Tuple[str, str]], knight.log)
+
+
+    # Any move after the last checkpoint may have been written (in part or in
+    # whole) to either file, since each file is written back independently.
+    # So every square whose value is greater than the last move committed is
+    # cleared, as is every entry of the move log after that move.
+
+    move_n = state['move_n']
+
+    for row in board.rows:
+
+        if (max(row) > move_n):
+
+            for j, v in enumerate(row):
+
+                if (v > move_n): row[j] = 0
+
+    knight.log.array.clear(move_n, (size * size))
+
+
+    knight.log.move_n = move_n
+
+    knight.move_n = move_n
+
+    knight.pos = knight.log.getPosition(knight.move_n)
+
+
+    version, internal, gauss = state['random']
+
+    random.setstate((version, tuple(internal), gauss))
+
+
+    return (board, knight)
+
+
+def validateSize(size: str) -> int: # -----------------------------------------
+    """ This FUNCTION ...
+    """ # ---------------------------------------------------------------------
+
+    # NOTE: The number of squares on the chessboard must be less than 2^32, so
+    #       that the value of each square can be stored as an unsigned 32-bit
+    #       integer.
+
+    if not (ktour.Chessboard.SIZE_MIN <= int(size) <= SIZE_MAX):
+
+        msg = "invalid num of squares per row/column (min {0:3d}, max {1:5d})"\
+            .format(ktour.Chessboard.SIZE_MIN, SIZE_MAX)
+
+        raise ArgumentTypeError(msg)
+
+
+    return int(size)
+
+
+def main(): # -----------------------------------------------------------------
+    """ This MAIN FUNCTION ...
+    """ # ---------------------------------------------------------------------
+
+    argparser = argparse.ArgumentParser(\
+        description= "This PROGRAM implements Warnsdorff's heuristic for\
+                      attempting to solve the knight's tour problem on very\
+                      large chessboards, stored in memory-mapped files.",\
+        epilog=      "~created by " + __author__\
+    )
+
+    argparser.add_argument(\
+        'dir',\
+        type=    str,\
+        help=    "directory in which the chessboard and moves are stored"\
+    )
+
+    argparser.add_argument(\
+        '--size',\
+        metavar= "N",\
+        type=    validateSize,\
+        default= "8",\
+        help=    "number of squares per row/column"\
+    )
+
+    argparser.add_argument(\
+        '--start',\
+        metavar= "P",\
+        type=    str,\
+        help=    "start position of knight (in algebraic notation)"\
+    )
+
+    argparser.add_argument(\
+        '--seed',\
+        type=    int,\
+        help=    "seed for pseudo-random number generation"\
+    )
+
+    argparser.add_argument(\
+        '--every',\
+        metavar= "K",\
+        type=    int,\
+        default= 100000,\
+        help=    "number of moves between checkpoints"\
+    )
+
+    argparser.add_argument(\
+        '--resume',\
+        action=  'store_true',\
+        help=    "resume from the last checkpoint in the directory"\
+    )
+
+    argparser.add_argument(\
+        '--force',\
+        action=  'store_true',\
+        help=    "overwrite any chessboard already in the directory"\
+    )
+
+
+    args = argparser.parse_args()
+
+
+    if args.resume:
+
+        try:
+
+            board, knight = resume(args.dir)
+
+        except (FileNotFoundError, json.JSONDecodeError):
+
+            argparser.error(\
+                "directory contains no checkpoint to resume: '{0}' (omit\
+ --resume to start a new tour)".format(args.dir)\
+            )
+
+    else:
+
+        random.seed() if args.seed is None else random.seed(args.seed)
+
+        start = ktour.getRandomPosition(args.size) if args.start is None\
+            else ktour.validateStartPosition(args.start, args.size)
+
+        try:
+
+            board, knight = create(args.dir, args.size, start, args.force)
+
+        except FileExistsError:
+
+            argparser.error(\
+                "directory already contains a chessboard: '{0}' (use --resume\
+ to resume it, or --force to overwrite it)".format(args.dir)\
+            )
+
+        checkpoint(args.dir, board, knight)
+
+
+    while True:
+
+        acts = knight.getActions(board)
+
+        if (len(acts) == 0): break
+
+
+        poses = ktour.getFewestPositions(acts)
+
+        pos = poses[0] if (len(poses) == 1)\
+            else ktour.getRandomPosition(board.size, poses)
+
+        knight.move(board, pos)
+
+
+        if ((knight.move_n % args.every) == 0):
+
+            checkpoint(args.dir, board, knight)
+
+
+    checkpoint(args.dir, board, knight)
+
+
+    print("{0} of {1} squares traversed ({2} x {2}), ending at '{3}'"\
+        .format(knight.move_n, (board.size * board.size), board.size,\
+            knight.pos\
+        )
+    )
+
+
+    knight.log.close()
+
+    board.close()
+
+
+if __name__ == '__main__': main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+
+
+# -----------------------------------------------------------------------------
+""" This MODULE contains the implementation for recording each move performed
+    by a knight piece to a file, and for reading any move of a recording back
+    without reading those before it.
+""" # -------------------------------------------------------------------------
+
+__author__ = '@kaethis'
+
+__version__ = '1.0'
+
+
+import os
+
+import struct
+
+import ktour
+
+from typing import List
+
+
+# NOTE: A recording consists of a header (a magic number, the number of squares
+#       per row/column, and the number of moves) followed by the square moved
+#       to by each move, as unsigned 32-bit integers.  Squares are referred to
+#       by number, (i.e. the square in row (n // size) and column (n % size)).
+#
+#       Since each move is of fixed width, any move can be read directly.  Of
+#       course, the value of each square on the chessboard is the number of
+#       the move that traversed it, so the chessboard after any move is just
+#       every square whose value is no greater than that move.
+
+MAGIC = b'KTRC'
+
+HEADER = struct.Struct('<4sII')
+
+SQUARE = struct.Struct('<I')
+
+
+class RecordingInvalidError(Exception): # -------------------------------------
+    """ This EXCEPTION is RAISED when a recording is invalid.
+    """ # ---------------------------------------------------------------------
+
+    def __init__(self, path: str): # ------------------------------------------
+
+        super().__init__("recording is invalid: '{0}'".format(path))
+
+
+class Recording: # ------------------------------------------------------------
+    """ This CLASS represents a recording of each move performed by a knight
+        piece on a square (n x n) chessboard.
+    """ # ---------------------------------------------------------------------
+
+    def __init__(self, path: str): # ------------------------------------------
+        """ This CONSTRUCTOR ...
+        """ # -----------------------------------------------------------------
+
+        self.file = open(path, 'rb')
+
+
+        try:
+
+            self.read(path)
+
+        except RecordingInvalidError:
+
+            self.file.close()
+
+            raise
+
+
+    def read(self, path: str): # ----------------------------------------------
+        """ This FUNCTION reads the header and every square's value of the
+            recording, RAISING a RecordingInvalidError if it is invalid.
+        """ # -----------------------------------------------------------------
+
+        header = self.file.read(HEADER.size)
+
+        if not (len(header) == HEADER.size):
+
+            raise RecordingInvalidError(path)
+
+
+        magic, self.size, self.move_n = HEADER.unpack(header)
+
+        if not (magic == MAGIC) or not (self.size > 0)\
+            or not (0 < self.move_n <= (self.size * self.size)):
+
+            raise RecordingInvalidError(path)
+
+        if not (os.fstat(self.file.fileno()).st_size\
+            == (HEADER.size + (self.move_n * SQUARE.size))):
+
+            raise RecordingInvalidError(path)
+
+
+        # Every square's value (i.e. the number of the move that traversed it)
+        # is read in one pass, so the chessboard after any move is known.  No
+        # square can be traversed more than once.
+
+        self.squares = [[0]*self.size for i in range(0, self.size)]
+
+        for move_i, sq in enumerate(self.getSquares(1, self.move_n), 1):
+
+            if not (sq < (self.size * self.size)):
+
+                raise RecordingInvalidError(path)
+
+            if not (self.squares[sq // self.size][sq % self.size] == 0):
+
+                raise RecordingInvalidError(path)
+
+
+            self.squares[sq // self.size][sq % self.size] = move_i
+
+
+    def getSquares(self, move_i: int, move_j: int) -> List[int]: # ------------
+        """ This FUNCTION returns a list of the squares (by number) moved to by
+            every move from one move to another (inclusive).
+        """ # -----------------------------------------------------------------
+
+        if not (0 < move_i <= move_j <= self.move_n):
+
+            raise IndexError
+
+
+        self.file.seek(HEADER.size + ((move_i-1) * SQUARE.size))
+
+        data = self.file.read((move_j - move_i + 1) * SQUARE.size)
+
+
+        return [sq for (sq,) in SQUARE.iter_unpack(data)]
+
+
+    def getPosition(self, move_i: int) -> str: # ------------------------------
+        """ This FUNCTION returns the position (in algebraic notation) moved to
+            by a specified move.
+        """ # -----------------------------------------------------------------
+
+        sq = self.getSquares(move_i, move_i)[0]
+
+        return ktour.getAlgebraicNotation((sq // self.size), (sq % self.size))
+
+
+    def close(self): # --------------------------------------------------------
+        """ This FUNCTION ...
+        """ # -----------------------------------------------------------------
+
+        self.file.close()
+
+
+def writeRecording(path: str, knight: ktour.Knight, size: int): # -------------
+    """ This FUNCTION writes each move performed by a knight piece on a square
+        (n x n) chessboard to a recording.
+    """ # ---------------------------------------------------------------------
+
+    with open(path, 'wb') as f:
+
+        f.write(HEADER.pack(MAGIC, size, knight.move_n))
+
+        for move_i in range(1, (knight.move_n+1)):
+
+            row, col = ktour.getRowColumn(knight.moves[move_i][1])
+
+            f.write(SQUARE.pack((row * size) + col))
@@ -0,0 +1,525 @@
+#!/usr/bin/env python3
+
+
+# -----------------------------------------------------------------------------
+""" This MODULE contains the implementation for running Warnsdorff's heuristic
+    many times (without any display) and aggregating statistics of every run
+    in constant memory.
+""" # -------------------------------------------------------------------------
+
+__author__ = '@kaethis'
+
+__version__ = '1.0'
+
+
+import argparse
+
+import multiprocessing
+
+import random
+
+import ktour
+
+import ktrace
+
+from argparse import ArgumentTypeError
+
+from contextlib import nullcontext
+
+from typing import Any, ContextManager, Dict, List, NamedTuple, Optional, Tuple
+
+
+TIES_MAX = len(ktour.JUMPS)
+
+
+# NOTE: Each process of the pool has its own tracer (if the batches are traced
+#       at all), initialized once by initWorker() and used by every batch.
+
+worker_tracer: Optional[ktrace.Tracer] = None
+
+
+class RunResult(NamedTuple): # ------------------------------------------------
+    """ This CLASS represents the result of a single run of Warnsdorff's
+        heuristic: the start and end positions (in algebraic notation), the
+        number of squares traversed, and the number of times each number of
+        positions were tied for the fewest actions.
+    """ # ---------------------------------------------------------------------
+
+    start: str
+
+    end: str
+
+    length: int
+
+    ties: Tuple[int, ...]
+
+
+class TourStats: # ------------------------------------------------------------
+    """ This CLASS represents statistics aggregated from any number of runs of
+        Warnsdorff's heuristic on a square (n x n) chessboard, (i.e. the number
+        of runs and complete tours from each start position, the number of runs
+        of each length, the number of runs ending at each square without
+        completing a tour, and the number of times each number of positions
+        were tied for the fewest actions).  The memory used depends only on
+        the size of the chessboard, not on the number of runs.
+    """ # ---------------------------------------------------------------------
+
+    def __init__(self, size: int): # ------------------------------------------
+        """ This CONSTRUCTOR ...
+        """ # -----------------------------------------------------------------
+
+        self.size = size
+
+        self.runs = [[0]*self.size for i in range(0, self.size)]
+
+        self.tours = [[0]*self.size for i in range(0, self.size)]
+
+        self.deadends = [[0]*self.size for i in range(0, self.size)]
+
+        self.lengths = [0] * ((self.size * self.size)+1)
+
+        self.ties = [0] * (TIES_MAX+1)
+
+
+    def add(self, result: RunResult): # ---------------------------------------
+        """ This FUNCTION aggregates the result of a single run.
+        """ # -----------------------------------------------------------------
+
+        row, col = ktour.getRowColumn(result.start)
+
+        self.runs[row][col] += 1
+
+        if (result.length == (self.size * self.size)):
+
+            self.tours[row][col] += 1
+
+        else:
+
+            row, col = ktour.getRowColumn(result.end)
+
+            self.deadends[row][col] += 1
+
+
+        self.lengths[result.length] += 1
+
+        for i, tie_n in enumerate(result.ties): self.ties[i] += tie_n
+
+
+    def merge(self, other: 'TourStats'): # ------------------------------------
+        """ This FUNCTION aggregates the statistics of other runs, (e.g. those
+            performed by another process).
+        """ # -----------------------------------------------------------------
+
+        if not (other.size == self.size):
+
+            raise ValueError("size mismatch: {0} != {1}"\
+                .format(other.size, self.size)\
+            )
+
+
+        for i in range(0, self.size):
+
+            for j in range(0, self.size):
+
+                self.runs[i][j] += other.runs[i][j]
+
+                self.tours[i][j] += other.tours[i][j]
+
+                self.deadends[i][j] += other.deadends[i][j]
+
+        for i, n in enumerate(other.lengths): self.lengths[i] += n
+
+        for i, n in enumerate(other.ties): self.ties[i] += n
+
+
+    def printReport(self): # --------------------------------------------------
+        """ This FUNCTION prints a summary of the statistics aggregated.
+        """ # -----------------------------------------------------------------
+
+        runs_n = sum(map(sum, self.runs))
+
+        tours_n = sum(map(sum, self.tours))
+
+
+        print("{0} runs, {1} tours ({2:.2f}%)"\
+            .format(runs_n, tours_n, percent(tours_n, runs_n))\
+        )
+
+        print()
+
+
+        # Print the percentage of runs from each start position that completed
+        # a tour as a square (n x n) grid.
+
+        print("tours per start position (%):")
+
+        printGrid([\
+            [round(percent(self.tours[i][j], self.runs[i][j]))\
+                for j in range(0, self.size)]\
+            for i in range(0, self.size)\
+        ])
+
+        print()
+
+
+        # Print the percentage of runs that did not complete a tour ending at
+        # each square as a square (n x n) grid.
+
+        print("dead ends per square (%):")
+
+        printGrid([\
+            [round(percent(self.deadends[i][j], (runs_n - tours_n)))\
+                for j in range(0, self.size)]\
+            for i in range(0, self.size)\
+        ])
+
+        print()
+
+
+        print("squares traversed:")
+
+        for length, n in enumerate(self.lengths):
+
+            if (n > 0): print("{0:03d} : {1}".format(length, n))
+
+        print()
+
+
+        print("positions tied for fewest actions:")
+
+        for tie_n, n in enumerate(self.ties):
+
+            if (n > 0): print("{0:03d} : {1}".format(tie_n, n))
+
+
+def percent(n: int, total: int) -> float: # -----------------------------------
+    """ This FUNCTION ...
+    """ # ---------------------------------------------------------------------
+
+    return (100 * n / total) if (total > 0) else 0.0
+
+
+def printGrid(values: List[List[int]]): # -------------------------------------
+    """ This FUNCTION prints values as a square (n x n) grid, in the same form
+        as Chessboard.printBoard().
+    """ # ---------------------------------------------------------------------
+
+    size = len(values)
+
+
+    print("    ", end= '')
+
+    for i in range (0, size):
+
+        print("{0:3s}".format(ktour.getColumnLetter(i)),\
+            end= '|' if (i < (size-1)) else ''\
+        )
+
+    print()
+
+
+    for i, rows in reversed(list(enumerate(values))):
+
+        print("{0:3d}".format(i+1), end= '|')
+
+        for val in rows:
+
+            print("{0:03d} ".format(val), end= '')
+
+        print()
+
+
+def traceStep(\
+        tracer: Optional[ktrace.Tracer], name: str, **args: Any\
+    ) -> ContextManager[None]: # ----------------------------------------------
+    """ This FUNCTION returns a span of a phase of a step if a tracer is
+        specified, or a context that does nothing otherwise.
+    """ # ---------------------------------------------------------------------
+
+    return nullcontext() if tracer is None\
+        else tracer.span(name, 'step', **args)
+
+
+def runTour(\
+        size: int, start: str, tracer: Optional[ktrace.Tracer]= None\
+    ) -> RunResult: # ---------------------------------------------------------
+    """ This FUNCTION moves a knight piece from a specified start position (in
+        algebraic notation) according to Warnsdorff's heuristic until no more
+        moves can be performed, and returns the result.
+
+        If a tracer is specified, the run is traced, as well as each phase
+        (i.e. finding the actions, breaking ties, and moving) of every step
+        that is sampled.
+    """ # ---------------------------------------------------------------------
+
+    ts = ktrace.getTimestamp()
+
+    board = ktour.Chessboard(size)
+
+    knight = ktour.Knight(board, start)
+
+
+    ties = [0] * (TIES_MAX+1)
+
+    while True:
+
+        # Only the phases of the steps that are sampled are traced.
+
+        step = tracer if (tracer is not None) and tracer.isSampled() else None
+
+
+        with traceStep(step, 'getActions', move=knight.move_n):
+
+            acts = knight.getActions(board)
+
+        if (len(acts) == 0): break
+
+
+        with traceStep(step, 'getFewestPositions', acts=len(acts)):
+
+            poses = ktour.getFewestPositions(acts)
+
+            ties[len(poses)] += 1
+
+            pos = poses[0] if (len(poses) == 1)\
+                else ktour.getRandomPosition(size, poses)
+
+        with traceStep(step, 'move', pos=pos):
+
+            knight.move(board, pos)
+
+
+    if tracer is not None:
+
+        tracer.complete('tour', 'tour', ts, (ktrace.getTimestamp() - ts),\
+            start=start, length=knight.move_n\
+        )
+
+
+    return RunResult(start, knight.pos, knight.move_n, tuple(ties))
+
+
+def runBatch(\
+        size: int, runs_n: int, start: Optional[str]= None,\
+        seed: Optional[int]= None, tracer: Optional[ktrace.Tracer]= None\
+    ) -> TourStats: # ---------------------------------------------------------
+    """ This FUNCTION runs Warnsdorff's heuristic a specified number of times
+        and returns the statistics aggregated from every run.
+
+        If no start position is specified, a pseudo-random position is used
+        for each run.
+    """ # ---------------------------------------------------------------------
+
+    ts = ktrace.getTimestamp()
+
+    random.seed() if seed is None else random.seed(seed)
+
+
+    stats = TourStats(size)
+
+    for i in range(0, runs_n):
+
+        pos = ktour.getRandomPosition(size) if start is None else start
+
+        stats.add(runTour(size, pos, tracer))
+
+
+    if tracer is not None:
+
+        tracer.complete('batch', 'worker', ts, (ktrace.getTimestamp() - ts),\
+            runs=runs_n, seed=seed\
+        )
+
+
+    return stats
+
+
+def initWorker(rate: Optional[float]): # --------------------------------------
+    """ This FUNCTION initializes a process of the pool, (i.e. its tracer, if
+        the batches are traced at all).
+    """ # ---------------------------------------------------------------------
+
+    global worker_tracer
+
+
+    worker_tracer = None if rate is None else ktrace.Tracer(rate=rate)
+
+    if worker_tracer is not None: worker_tracer.name('worker')
+
+
+def runJob(\
+        job: Tuple[int, int, Optional[str], Optional[int]]\
+    ) -> Tuple[TourStats, List[Dict[str, Any]]]: # ----------------------------
+    """ This FUNCTION runs a batch (in a process of the pool) and returns the
+        statistics aggregated from every run, and the events traced since the
+        last batch (if the batches are traced at all).
+    """ # ---------------------------------------------------------------------
+
+    size, runs_n, start, seed = job
+
+    stats = runBatch(size, runs_n, start, seed, worker_tracer)
+
+    if worker_tracer is None: return (stats, [])
+
+
+    events = worker_tracer.events
+
+    worker_tracer.events = []
+
+
+    return (stats, events)
+
+
+def validateCount(n: str) -> int: # -------------------------------------------
+    """ This FUNCTION ...
+    """ # ---------------------------------------------------------------------
+
+    if not (int(n) >= 1):
+
+        msg = "invalid num (min {0:3d})".format(1)
+
+        raise ArgumentTypeError(msg)
+
+
+    return int(n)
+
+
+def main(): # -----------------------------------------------------------------
+    """ This MAIN FUNCTION ...
+    """ # ---------------------------------------------------------------------
+
+    argparser = argparse.ArgumentParser(\
+        description= "This PROGRAM runs Warnsdorff's heuristic many times and\
+                      prints a summary of the statistics of every run.",\
+        epilog=      "~created by " + __author__\
+    )
+
+    argparser.add_argument(\
+        '--size',\
+        metavar= "N",\
+        type=    ktour.validateSize,\
+        default= "8",\
+        help=    "number of squares per row/column"\
+    )
+
+    argparser.add_argument(\
+        '--start',\
+        metavar= "P",\
+        type=    str,\
+        help=    "start position of knight (in algebraic notation)"\
+    )
+
+    argparser.add_argument(\
+        '--seed',\
+        type=    int,\
+        help=    "seed for pseudo-random number generation"\
+    )
+
+    argparser.add_argument(\
+        '--runs',\
+        metavar= "R",\
+        type=    validateCount,\
+        default= 1000,\
+        help=    "number of runs"\
+    )
+
+    argparser.add_argument(\
+        '--workers',\
+        metavar= "W",\
+        type=    validateCount,\
+        default= multiprocessing.cpu_count(),\
+        help=    "number of processes"\
+    )
+
+    argparser.add_argument(\
+        '--chunk',\
+        metavar= "C",\
+        type=    validateCount,\
+        default= 1000,\
+        help=    "number of runs per batch of each process"\
+    )
+
+    argparser.add_argument(\
+        '--trace',\
+        metavar= "FILE",\
+        type=    str,\
+        help=    "write a trace to a file (in Chrome trace format)"\
+    )
+
+    argparser.add_argument(\
+        '--trace-rate',\
+        metavar= "RATE",\
+        type=    ktrace.validateRate,\
+        default= 0.01,\
+        help=    "rate (from 0 to 1) of steps of each run that are traced"\
+    )
+
+
+    args = argparser.parse_args()
+
+
+    start = None if args.start is None\
+        else ktour.validateStartPosition(args.start, args.size)
+
+
+    # Split the runs into batches, each of which is seeded differently (if a
+    # seed was provided) and aggregated separately by a process.  Only the
+    # statistics aggregated from each batch are merged.
+
+    jobs = [\
+        (\
+            args.size,\
+            min(args.chunk, (args.runs - i)),\
+            start,\
+            None if args.seed is None else (args.seed + i)\
+        ) for i in range(0, args.runs, args.chunk)\
+    ]
+
+
+    tracer = None if args.trace is None\
+        else ktrace.Tracer(args.trace, args.trace_rate)
+
+    if tracer is not None: tracer.name('main')
+
+    ts = ktrace.getTimestamp()
+
+
+    stats = TourStats(args.size)
+
+    rate = None if args.trace is None else args.trace_rate
+
+    with multiprocessing.Pool(args.workers, initWorker, (rate,)) as pool:
+
+        for batch, events in pool.imap_unordered(runJob, jobs):
+
+            if tracer is not None:
+
+                with tracer.span('merge', 'io', events=len(events)):
+
+                    tracer.extend(events)
+
+                    stats.merge(batch)
+
+            else:
+
+                stats.merge(batch)
+
+
+    if tracer is not None:
+
+        tracer.complete('pool', 'main', ts, (ktrace.getTimestamp() - ts),\
+            runs=args.runs, workers=args.workers\
+        )
+
+        with tracer.span('printReport', 'io'):
+
+            stats.printReport()
+
+        tracer.close()
+
+    else:
+
+        stats.printReport()
+
+
+if __name__ == '__main__': main()
@@ -17,7 +17,26 @@ import re
 
 from argparse import ArgumentTypeError
 
-from typing import Dict, List, Tuple, Optional, cast
+from typing import Any, Dict, List, Tuple, Optional, cast
+
+
+# NOTE: NumPy is an optional dependency.  If it is not installed, any bulk
+#       computations that would otherwise use NumPy arrays fall back to plain
+#       Python lists.
+
+try:
+
+    import numpy    # type: ignore
+
+except ImportError:
+
+    numpy = None
+
+
+JUMPS = (\
+    ( 2,  1), ( 2, -1), (-2,  1), (-2, -1),\
+    ( 1,  2), ( 1, -2), (-1,  2), (-1, -2)\
+)
 
 
 class PositionInvalidError(Exception): # --------------------------------------
@@ -232,9 +251,16 @@ class Knight: # ---------------------------------------------------------------
         board.setSquare(self.pos, self.move_n)
 
     
-    def move(self, board:Chessboard, pos: str): # ------------------------------
+    def move(\
+            self, board: Chessboard, pos: str,\
+            degmap: Optional['DegreeMap']= None,\
+            zhash: Optional['ZobristHash']= None\
+        ): # ------------------------------------------------------------------
         """ This FUNCTION moves the knight piece from its current position to
             a position specified (in algebraic notation).
+
+            If a map of the number of actions from each square and/or a hash of
+            the chessboard is specified, it is updated accordingly.
         """ # -----------------------------------------------------------------
         
         row, col = getRowColumn(pos)
@@ -248,6 +274,9 @@ class Knight: # ---------------------------------------------------------------
             raise PositionTraversedError(pos, board.getSquare(pos))
 
 
+        if zhash is not None: zhash.update(self.pos, pos)
+
+
         self.move_n += 1
 
         self.moves[self.move_n] = (self.pos, pos)
@@ -258,6 +287,65 @@ class Knight: # ---------------------------------------------------------------
         board.setSquare(self.pos, self.move_n)
 
 
+        if degmap is not None: degmap.update(self.pos)
+
+
+    def undo(\
+            self, board: Chessboard,\
+            degmap: Optional['DegreeMap']= None,\
+            zhash: Optional['ZobristHash']= None\
+        ) -> Tuple[str, str]: # -----------------------------------------------
+        """ This FUNCTION undoes the last move performed by the knight piece,
+            moving it back to its previous position and clearing the square it
+            had traversed on the chessboard.  The move undone is returned.
+
+            If a map of the number of actions from each square and/or a hash of
+            the chessboard is specified, it is reverted accordingly.
+        """ # -----------------------------------------------------------------
+
+        if not (self.move_n > 1):
+
+            raise IndexError
+
+
+        move = self.moves.pop(self.move_n)
+
+        self.move_n -= 1
+
+        self.pos = move[0]
+
+
+        board.clear(move[1])
+
+
+        if degmap is not None: degmap.revert(move[1])
+
+        if zhash is not None: zhash.revert(move[0], move[1])
+
+
+        return move
+
+
+    def rewind(\
+            self, board: Chessboard, move_i: int,\
+            degmap: Optional['DegreeMap']= None,\
+            zhash: Optional['ZobristHash']= None\
+        ): # ------------------------------------------------------------------
+        """ This FUNCTION undoes every move performed by the knight piece after
+            a specified move, (i.e. the knight piece is returned to the
+            position it was in after that move was performed).
+        """ # -----------------------------------------------------------------
+
+        if not (0 < move_i <= self.move_n):
+
+            raise IndexError
+
+
+        while (self.move_n > move_i):
+
+            self.undo(board, degmap, zhash)
+
+
     def getMove(self, move_i: int) -> Tuple[str, str]: # ---------------------
         """ This FUNCTION ...
         """ # -----------------------------------------------------------------
@@ -278,7 +366,8 @@ class Knight: # ---------------------------------------------------------------
 
 
     def getActions(\
-            self, board: Chessboard, pos: str=None\
+            self, board: Chessboard, pos: Optional[str]= None,\
+            degmap: Optional['DegreeMap']= None\
         ) -> Dict[str, int]: # ------------------------------------------------
         """ This FUNCTION returns a dictionary containing every position (as
             key) and corresponding number of actions from that position (as
@@ -286,6 +375,8 @@ class Knight: # ---------------------------------------------------------------
             a specified position (in algebraic notation).
 
             If no position is specified, the knight's current position is used.
+            If a map of the number of actions from each square is specified,
+            the number of actions is looked up rather than counted.
         """ # -----------------------------------------------------------------
 
         if pos is None: pos = self.pos
@@ -310,7 +401,8 @@ class Knight: # ---------------------------------------------------------------
                     
                     pos_to = getAlgebraicNotation(row_to, col_to)
 
-                    act_n = self.getActionsCount(board, pos_to)
+                    act_n = self.getActionsCount(board, pos_to)\
+                        if degmap is None else degmap.degrees[row_to][col_to]
 
 
                     acts[pos_to] = act_n
@@ -415,6 +507,487 @@ class Knight: # ---------------------------------------------------------------
         print("({})".format(pos_n))
 
 
+class DegreeMap: # ------------------------------------------------------------
+    """ This CLASS represents the number of actions (i.e. the number of valid
+        squares not yet traversed) from each and every square on a chessboard.
+
+        The entire map is computed in a single pass and can then be updated
+        incrementally as the knight piece traverses the chessboard, rather
+        than calling Knight.getActionsCount() for every square.
+    """ # ---------------------------------------------------------------------
+
+    def __init__(self, board: Chessboard): # ----------------------------------
+        """ This CONSTRUCTOR ...
+        """ # -----------------------------------------------------------------
+
+        self.size = board.size
+
+        self.jumps = getJumpTable(self.size)
+
+        self.degrees = [[0]*self.size for i in range(0, self.size)]
+
+
+        self.compute(board)
+
+
+    def compute(self, board: Chessboard): # -----------------------------------
+        """ This FUNCTION computes the number of actions from each and every
+            square on a chessboard.
+
+            If NumPy is available, the number of actions is computed by adding
+            the untraversed squares shifted by each jump.  Otherwise, each
+            square's precomputed table of jumps is counted.
+        """ # -----------------------------------------------------------------
+
+        if numpy is not None:
+
+            n = self.size
+
+            free = numpy.zeros(((n+4), (n+4)), dtype=numpy.int8)
+
+            free[2:(n+2), 2:(n+2)] = (numpy.array(board.squares) == 0)
+
+
+            degs = numpy.zeros((n, n), dtype=numpy.int8)
+
+            for jmp in JUMPS:
+
+                degs += free[\
+                    (2+jmp[0]):(n+2+jmp[0]), (2+jmp[1]):(n+2+jmp[1])\
+                ]
+
+            self.degrees = degs.tolist()
+
+        else:
+
+            squares = board.squares
+
+            for i in range(0, self.size):
+
+                row = self.degrees[i]
+
+                for j, jmps in enumerate(self.jumps[i]):
+
+                    row[j] = sum(\
+                        1 for (r, c) in jmps if (squares[r][c] == 0)\
+                    )
+
+
+    def update(self, pos: str): # ---------------------------------------------
+        """ This FUNCTION updates the map after the square at the position
+            specified (in algebraic notation) has been traversed, (i.e. every
+            square a jump away from that position has one fewer action).
+        """ # -----------------------------------------------------------------
+
+        row, col = getRowColumn(pos)
+
+        for (r, c) in self.jumps[row][col]:
+
+            self.degrees[r][c] -= 1
+
+
+    def revert(self, pos: str): # ---------------------------------------------
+        """ This FUNCTION reverts the map after the square at the position
+            specified (in algebraic notation) has been cleared, (i.e. every
+            square a jump away from that position has one more action).
+        """ # -----------------------------------------------------------------
+
+        row, col = getRowColumn(pos)
+
+        for (r, c) in self.jumps[row][col]:
+
+            self.degrees[r][c] += 1
+
+
+    def getDegree(self, pos: str) -> int: # -----------------------------------
+        """ This FUNCTION returns the number of actions from a specified
+            position (in algebraic notation).
+        """ # -----------------------------------------------------------------
+
+        row, col = getRowColumn(pos)
+
+        if not (0 <= row < self.size) or not (0 <= col < self.size):
+
+            raise PositionInvalidError(pos)
+
+
+        return self.degrees[row][col]
+
+
+class ZobristHash: # ----------------------------------------------------------
+    """ This CLASS represents a Zobrist hash of the state of a chessboard,
+        (i.e. the set of squares traversed and the knight's current position).
+
+        A pseudo-random 64-bit key is assigned to each square traversed and to
+        each position of the knight piece.  The hash is the exclusive-or of
+        the keys of the state, so it can be updated incrementally with each
+        move (and reverted with each undo) in constant time.
+    """ # ---------------------------------------------------------------------
+
+    def __init__(\
+            self, board: Chessboard, pos: str, seed: Optional[int]= None\
+        ): # ------------------------------------------------------------------
+        """ This CONSTRUCTOR ...
+        """ # -----------------------------------------------------------------
+
+        rand = random.Random(seed)
+
+        self.size = board.size
+
+        self.squares = [\
+            [rand.getrandbits(64) for j in range(0, self.size)]\
+            for i in range(0, self.size)\
+        ]
+
+        self.knights = [\
+            [rand.getrandbits(64) for j in range(0, self.size)]\
+            for i in range(0, self.size)\
+        ]
+
+
+        self.compute(board, pos)
+
+
+    def compute(self, board: Chessboard, pos: str): # -------------------------
+        """ This FUNCTION computes the hash of a chessboard with the knight
+            piece at a specified position (in algebraic notation).
+        """ # -----------------------------------------------------------------
+
+        self.value = 0
+
+        for i in range(0, self.size):
+
+            for j in range(0, self.size):
+
+                if not (board.squares[i][j] == 0):
+
+                    self.value ^= self.squares[i][j]
+
+        row, col = getRowColumn(pos)
+
+        self.value ^= self.knights[row][col]
+
+
+    def update(self, pos_from: str, pos_to: str): # ---------------------------
+        """ This FUNCTION updates the hash after the knight piece has moved
+            from one position to another (in algebraic notation).
+        """ # -----------------------------------------------------------------
+
+        row_from, col_from = getRowColumn(pos_from)
+
+        row_to, col_to = getRowColumn(pos_to)
+
+
+        self.value ^= self.knights[row_from][col_from]
+
+        self.value ^= self.knights[row_to][col_to]
+
+        self.value ^= self.squares[row_to][col_to]
+
+
+    def revert(self, pos_from: str, pos_to: str): # ---------------------------
+        """ This FUNCTION reverts the hash after a move of the knight piece
+            from one position to another (in algebraic notation) is undone.
+        """ # -----------------------------------------------------------------
+
+        # NOTE: Since exclusive-or is its own inverse, reverting a move is the
+        #       very same as updating it.
+
+        self.update(pos_from, pos_to)
+
+
+class TranspositionTable: # ---------------------------------------------------
+    """ This CLASS represents a bounded table of states of a chessboard (by
+        hash) that have already been searched, each with the number of moves
+        performed (i.e. its depth) and a value, (e.g. the number of tours that
+        can be completed from that state, where zero indicates a dead end).
+
+        Once the table is full, entries are evicted either by depth, (i.e. the
+        oldest of the deepest states, which are the cheapest to search again),
+        or by age, (i.e. the oldest state).
+    """ # ---------------------------------------------------------------------
+
+    EVICT_DEPTH = 'depth'
+
+    EVICT_AGE = 'age'
+
+
+    def __init__(self, capacity: int, evict: str= EVICT_DEPTH): # -------------
+        """ This CONSTRUCTOR ...
+        """ # -----------------------------------------------------------------
+
+        if not (capacity > 0):
+
+            raise ValueError("capacity must be positive: {0}".format(capacity))
+
+        if evict not in (self.EVICT_DEPTH, self.EVICT_AGE):
+
+            raise ValueError("invalid eviction: '{0}'".format(evict))
+
+
+        self.capacity = capacity
+
+        self.evict = evict
+
+        self.entries: Dict[int, Tuple[int, Any]] = {}
+
+        self.depths: Dict[int, Dict[int, None]] = {}
+
+
+    def __len__(self) -> int: # -----------------------------------------------
+
+        return len(self.entries)
+
+
+    def __contains__(self, key: int) -> bool: # -------------------------------
+
+        return key in self.entries
+
+
+    def lookup(self, key: int) -> Optional[Any]: # ----------------------------
+        """ This FUNCTION returns the value of a state (by hash), or None if
+            the state is not in the table.
+        """ # -----------------------------------------------------------------
+
+        entry = self.entries.get(key)
+
+        return None if entry is None else entry[1]
+
+
+    def store(self, key: int, depth: int, value: Any= 0): # -------------------
+        """ This FUNCTION stores the value of a state (by hash) at a specified
+            depth, evicting another state if the table is full.
+        """ # -----------------------------------------------------------------
+
+        if key in self.entries:
+
+            self.remove(key)
+
+        elif (len(self.entries) >= self.capacity):
+
+            self.remove(self.getEvictee())
+
+
+        self.entries[key] = (depth, value)
+
+        self.depths.setdefault(depth, {})[key] = None
+
+
+    def remove(self, key: int): # ---------------------------------------------
+        """ This FUNCTION removes a state (by hash) from the table.
+        """ # -----------------------------------------------------------------
+
+        depth, value = self.entries.pop(key)
+
+        del self.depths[depth][key]
+
+        if (len(self.depths[depth]) == 0): del self.depths[depth]
+
+
+    def getEvictee(self) -> int: # --------------------------------------------
+        """ This FUNCTION returns the state (by hash) to be evicted next.
+        """ # -----------------------------------------------------------------
+
+        # NOTE: Dictionaries preserve insertion order, so the first key of
+        #       either dictionary is its oldest.
+
+        if (self.evict == self.EVICT_AGE):
+
+            return next(iter(self.entries))
+
+        else:
+
+            return next(iter(self.depths[max(self.depths)]))
+
+
+    def clear(self): # --------------------------------------------------------
+        """ This FUNCTION ...
+        """ # -----------------------------------------------------------------
+
+        self.entries.clear()
+
+        self.depths.clear()
+
+
+def findTour(\
+        board: Chessboard, knight: Knight,\
+        table: Optional[TranspositionTable]= None\
+    ) -> bool: # --------------------------------------------------------------
+    """ This FUNCTION searches (by backtracking) for a sequence of moves of
+        the knight piece from its current position that traverses every
+        remaining square on the chessboard.  Moves are attempted in order of
+        fewest actions, as per Warnsdorff's heuristic.
+
+        If such a sequence exists, the knight piece is left at the end of the
+        tour and True is returned.  Otherwise, the knight piece is returned to
+        its current position and False is returned.
+
+        If a transposition table is specified, every state proven to be a dead
+        end is stored in it and never searched again.
+    """ # ---------------------------------------------------------------------
+
+    squares_n = (board.size * board.size)
+
+    degmap = DegreeMap(board)
+
+    zhash = ZobristHash(board, knight.pos)
+
+
+    def getOrderedPositions() -> List[str]: # ---------------------------------
+
+        acts = knight.getActions(board, degmap=degmap)
+
+        return sorted(acts, key=lambda p: acts[p], reverse=True)
+
+
+    stack = [getOrderedPositions()]
+
+    while (knight.move_n < squares_n):
+
+        if not (len(stack[-1]) == 0):
+
+            knight.move(board, stack[-1].pop(), degmap, zhash)
+
+            if (table is not None) and (zhash.value in table):
+
+                knight.undo(board, degmap, zhash)
+
+            else:
+
+                stack.append(getOrderedPositions())
+
+        else:
+
+            stack.pop()
+
+            if table is not None: table.store(zhash.value, knight.move_n)
+
+            if (len(stack) == 0): return False
+
+
+            knight.undo(board, degmap, zhash)
+
+
+    return True
+
+
+def closeTour(\
+        knight: Knight, size: int, budget: int= 100000\
+    ) -> Optional[List[str]]: # -----------------------------------------------
+    """ This FUNCTION returns a list of positions (in algebraic notation) of a
+        closed tour, (i.e. one in which the very last position is a jump away
+        from the start position), converted from the open tour performed by
+        the knight piece on a square (n x n) chessboard.
+
+        The tour is rotated (as per Posa) until its ends are a jump away from
+        each other: if an end of the tour is a jump away from some position in
+        the tour, the positions between them are reversed, so that the tour
+        has a different end.  The closed tour is returned starting from the
+        knight's start position, or None if no such tour is found within a
+        specified number of rotations.
+    """ # ---------------------------------------------------------------------
+
+    squares_n = (size * size)
+
+    if not (knight.move_n == squares_n):
+
+        raise ValueError("tour is incomplete: {0:03d}".format(knight.move_n))
+
+    # NOTE: Each move of a knight piece traverses a square of the opposite
+    #       color, so there is no closed tour on a chessboard with an odd
+    #       number of squares.
+
+    if not ((squares_n % 2) == 0): return None
+
+
+    table = getJumpTable(size)
+
+    jumps = [\
+        [((r * size) + c) for (r, c) in table[i][j]]\
+        for i in range(0, size) for j in range(0, size)\
+    ]
+
+
+    # NOTE: Squares are referred to by number, (i.e. the square in row (n //
+    #       size) and column (n % size)), and the index of each square in the
+    #       tour is kept so that any square can be found in constant time.
+
+    tour = []
+
+    for move_i in range(1, (knight.move_n+1)):
+
+        row, col = getRowColumn(knight.moves[move_i][1])
+
+        tour.append((row * size) + col)
+
+    index = [0] * squares_n
+
+    for i, sq in enumerate(tour): index[sq] = i
+
+
+    def reverse(i: int, j: int): # --------------------------------------------
+
+        tour[i:j] = tour[i:j][::-1]
+
+        for k in range(i, j): index[tour[k]] = k
+
+
+    for rotation_n in range(0, budget):
+
+        if tour[0] in jumps[tour[-1]]: break
+
+
+        if ((rotation_n % 2) == 0):
+
+            # Rotate the end of the tour: for each square a jump away from the
+            # end, reversing the squares after it makes its successor the end.
+
+            pivots = [\
+                (index[sq]+1) for sq in jumps[tour[-1]]\
+                if (index[sq] < (squares_n-2))\
+            ]
+
+            if (len(pivots) == 0): continue
+
+
+            closers = [i for i in pivots if tour[0] in jumps[tour[i]]]
+
+            i = closers[0] if (len(closers) > 0) else random.choice(pivots)
+
+            reverse(i, squares_n)
+
+        else:
+
+            # Rotate the start of the tour: for each square a jump away from
+            # the start, reversing the squares before it makes its predecessor
+            # the start.
+
+            pivots = [index[sq] for sq in jumps[tour[0]] if (index[sq] > 1)]
+
+            if (len(pivots) == 0): continue
+
+
+            closers = [j for j in pivots if tour[-1] in jumps[tour[j-1]]]
+
+            j = closers[0] if (len(closers) > 0) else random.choice(pivots)
+
+            reverse(0, j)
+
+
+    if not (tour[0] in jumps[tour[-1]]): return None
+
+
+    row, col = getRowColumn(knight.moves[1][1])
+
+    i = index[(row * size) + col]
+
+
+    return [\
+        getAlgebraicNotation((sq // size), (sq % size))\
+        for sq in (tour[i:] + tour[:i])\
+    ]
+
+
 def getAlgebraicNotation(row: int, col: int) -> str: # ------------------------
     """ This FUNCTION returns the algebraic notation of the corresponding row
         and column of a square on a chessboard (of any size).
@@ -488,6 +1061,39 @@ def getColumnNumber(ltr: str) -> int : # --------------------------------------
     return n
 
 
+_jump_tables: Dict[int, List[List[Tuple[Tuple[int, int], ...]]]] = {}
+
+
+def getJumpTable(\
+        size: int\
+    ) -> List[List[Tuple[Tuple[int, int], ...]]]: # ---------------------------
+    """ This FUNCTION returns a square (n x n) table containing the row and
+        column of every valid square a jump away from each square on a
+        chessboard (of any size).
+    """ # ---------------------------------------------------------------------
+
+    if size not in _jump_tables:
+
+        table: List[List[Tuple[Tuple[int, int], ...]]] = [\
+            [()]*size for i in range(0, size)\
+        ]
+
+        for i in range(0, size):
+
+            for j in range(0, size):
+
+                table[i][j] = tuple(\
+                    ((i + jmp[0]), (j + jmp[1])) for jmp in JUMPS\
+                    if (0 <= (i + jmp[0]) < size)\
+                    and (0 <= (j + jmp[1]) < size)\
+                )
+
+        _jump_tables[size] = table
+
+
+    return _jump_tables[size]
+
+
 def getFewestPositions(acts: Dict[str, int]) -> Tuple[str, ...]: # ------------
     """ This FUNCTION returns a tuple of positions (in algebraic notation) with
         the fewest number of actions from a dictionary of positions (as key)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+
+
+# -----------------------------------------------------------------------------
+""" This MODULE contains the implementation for tracing where time is spent by
+    a program, as events in the Chrome trace format, (i.e. a JSON array of
+    events that can be loaded by chrome://tracing or https://ui.perfetto.dev).
+""" # -------------------------------------------------------------------------
+
+__author__ = '@kaethis'
+
+__version__ = '1.0'
+
+
+import json
+
+import os
+
+import threading
+
+import time
+
+from argparse import ArgumentTypeError
+
+from contextlib import contextmanager
+
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class Tracer: # ---------------------------------------------------------------
+    """ This CLASS represents a trace of events.  Events are either written to
+        a file as they occur or, if no file is specified, kept in a list (e.g.
+        by another process, to be written by the process with the file).
+
+        A specified rate (from 0 to 1) of steps is sampled, so that tracing
+        every step of a long run does not overwhelm the trace.
+    """ # ---------------------------------------------------------------------
+
+    def __init__(\
+            self, path: Optional[str]= None, rate: float= 1.0\
+        ): # ------------------------------------------------------------------
+        """ This CONSTRUCTOR ...
+        """ # -----------------------------------------------------------------
+
+        if not (0.0 <= rate <= 1.0):
+
+            raise ValueError("invalid sample rate: {0}".format(rate))
+
+
+        self.rate = rate
+
+        self.credit = 0.0
+
+        self.events: List[Dict[str, Any]] = []
+
+        self.file = None if path is None else open(path, 'w')
+
+        self.event_n = 0
+
+
+        if self.file is not None: self.file.write("[\n")
+
+
+    def isSampled(self) -> bool: # --------------------------------------------
+        """ This FUNCTION returns whether or not the next step is sampled.
+        """ # -----------------------------------------------------------------
+
+        # NOTE: Steps are sampled at evenly spaced intervals (rather than
+        #       pseudo-randomly), so tracing never affects the sequence of
+        #       pseudo-random numbers of the program being traced.
+
+        self.credit += self.rate
+
+        if (self.credit >= 1.0):
+
+            self.credit -= 1.0
+
+            return True
+
+
+        return False
+
+
+    def emit(self, event: Dict[str, Any]): # ----------------------------------
+        """ This FUNCTION ...
+        """ # -----------------------------------------------------------------
+
+        if self.file is None:
+
+            self.events.append(event)
+
+        else:
+
+            self.file.write(",\n" if (self.event_n > 0) else "")
+
+            self.file.write(json.dumps(event))
+
+            self.event_n += 1
+
+
+    def extend(self, events: List[Dict[str, Any]]): # -------------------------
+        """ This FUNCTION emits every event of another trace.
+        """ # -----------------------------------------------------------------
+
+        for event in events: self.emit(event)
+
+
+    def complete(\
+            self, name: str, cat: str, ts: float, dur: float, **args: Any\
+        ): # ------------------------------------------------------------------
+        """ This FUNCTION emits a complete event, (i.e. a span of time with a
+            start and duration in microseconds).
+        """ # -----------------------------------------------------------------
+
+        self.emit({\
+            'name' : name,\
+            'cat'  : cat,\
+            'ph'   : 'X',\
+            'ts'   : ts,\
+            'dur'  : dur,\
+            'pid'  : os.getpid(),\
+            'tid'  : threading.get_native_id(),\
+            'args' : args\
+        })
+
+
+    @contextmanager
+    def span(self, name: str, cat: str, **args: Any) -> Iterator[None]: # -----
+        """ This FUNCTION emits a complete event spanning the time taken by the
+            body of a WITH statement.
+        """ # -----------------------------------------------------------------
+
+        ts = getTimestamp()
+
+        try:
+
+            yield
+
+        finally:
+
+            self.complete(name, cat, ts, (getTimestamp() - ts), **args)
+
+
+    def name(self, name: str): # ----------------------------------------------
+        """ This FUNCTION emits a metadata event naming the current process.
+        """ # -----------------------------------------------------------------
+
+        self.emit({\
+            'name' : 'process_name',\
+            'ph'   : 'M',\
+            'pid'  : os.getpid(),\
+            'args' : {'name' : "{0} ({1})".format(name, os.getpid())}\
+        })
+
+
+    def close(self): # --------------------------------------------------------
+        """ This FUNCTION ...
+        """ # -----------------------------------------------------------------
+
+        if self.file is not None:
+
+            self.file.write("\n]\n")
+
+            self.file.close()
+
+
+def getTimestamp() -> float: # ------------------------------------------------
+    """ This FUNCTION returns the current time in microseconds.
+    """ # ---------------------------------------------------------------------
+
+    # NOTE: The system time (rather than a performance counter) is used, so
+    #       that the timestamps of events of different processes agree.
+
+    return (time.time_ns() / 1000)
+
+
+def validateRate(rate: str) -> float: # ---------------------------------------
+    """ This FUNCTION ...
+    """ # ---------------------------------------------------------------------
+
+    if not (0.0 <= float(rate) <= 1.0):
+
+        msg = "invalid sample rate (min {0:.1f}, max {1:.1f})".format(0.0, 1.0)
+
+        raise ArgumentTypeError(msg)
+
+
+    return float(rate)